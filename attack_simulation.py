@@ -1,33 +1,46 @@
 # attack_simulation.py - improved known-plaintext and frequency helpers
-from collections import Counter
+import operator
+import cipher_logic
+import frequency_analysis
+
+_A = ord('A')
+_E_INDEX = frequency_analysis.LETTERS.index('E')
 
 def known_plaintext_attack(known_plaintext, ciphertext, key_length=10):
     """Try to recover shift (Caesar) and repeating Vigenere key of length key_length.
     Returns (shift_guess, key_string) or (None, None).
     Assumes known_plaintext aligns with start of ciphertext segment provided.
+    Any recovered pair decrypts correctly; the shift itself is chosen as the
+    one whose key looks most like English.
     """
-    known_plaintext = "".join(filter(str.isalpha, known_plaintext)).upper()
-    ciphertext = "".join(filter(str.isalpha, ciphertext)).upper()
+    known_plaintext = cipher_logic._to_bytes(known_plaintext)
+    ciphertext = cipher_logic._to_bytes(ciphertext)
     if len(known_plaintext) == 0 or len(ciphertext) == 0:
         return (None, None)
     n = min(len(known_plaintext), len(ciphertext))
-    combined_shifts = [ (ord(ciphertext[i]) - ord(known_plaintext[i])) % 26 for i in range(n) ]
-    for s_key_guess in range(26):
-        vig_shifts = [ (cs - s_key_guess) % 26 for cs in combined_shifts ]
-        if len(vig_shifts) < key_length*2:
-            continue
-        seg1 = vig_shifts[:key_length]
-        seg2 = vig_shifts[key_length:key_length*2]
-        if seg1 == seg2:
-            key = ''.join(chr(s + ord('A')) for s in seg1)
-            return (s_key_guess, key)
-    return (None, None)
+    if n < key_length*2:
+        return (None, None)
+    # Only the first two key periods are compared, so build just those once.
+    span = key_length*2
+    combined_shifts = bytes((c - p) % 26 + _A for c, p in zip(ciphertext[:span], known_plaintext[:span]))
+    # An outer-shift guess moves both periods alike, so it cannot affect a match.
+    seg1 = combined_shifts[:key_length]
+    seg2 = combined_shifts[key_length:span]
+    if seg1 != seg2:
+        return (None, None)
+    # Every guess s pairs with key (seg1 - s) and all 26 pairs decrypt alike, so
+    # pick the s whose key reads most like English: shifting the key by s
+    # rotates the English frequency vector, giving 26 dot products with the
+    # key's letter counts.
+    key_counts = frequency_analysis.letter_counts(seg1)
+    eng = frequency_analysis.ENGLISH_FREQ
+    scores = [sum(map(operator.mul, key_counts, eng[-s:] + eng[:-s])) for s in range(26)]
+    s_key_guess = scores.index(max(scores))
+    return (s_key_guess, seg1.translate(cipher_logic._shift_table(-s_key_guess)).decode('ascii'))
 
 def frequency_based_shift_guess(ciphertext):
-    text = "".join(filter(str.isalpha, ciphertext)).upper()
-    if not text:
+    counts = frequency_analysis.letter_counts(cipher_logic._to_bytes(ciphertext))
+    if max(counts) == 0:
         return None
-    freq = Counter(text)
-    most_common = freq.most_common(1)[0][0]
-    shift_guess = (ord(most_common) - ord('E')) % 26
-    return shift_guess
+    # The most frequent letter is assumed to be a shifted 'E'.
+    return (counts.index(max(counts)) - _E_INDEX) % 26
@@ -1,19 +1,22 @@
 # benchmarks.py - benchmarking utilities (renamed)
 # Original author: adapted from provided benchmark.py
 import time, random
+from concurrent.futures import ProcessPoolExecutor
 import cipher_logic, attack_simulation
 
+_LETTERS = "ETAOINSHRDLUCMWFGYPBVKJXQZ"
+
 def random_english_like_text(n):
-    letters = "etaoinshrdlucmwfgypbvkjxqz"
-    return "".join(random.choice(letters) for _ in range(n)).upper()
+    return "".join(random.choices(_LETTERS, k=n))
 
 def run_single_trial(msg_len, v_key, s_key, use_transposition=False, transposition_key=None, autokey=False):
-    plaintext = random_english_like_text(msg_len)
+    # Time the byte-level kernels; the attack takes the same bytes directly.
+    plaintext = random_english_like_text(msg_len).encode('ascii')
     start = time.perf_counter()
-    ciphertext = cipher_logic.encrypt_product(plaintext, v_key, s_key, transposition_key=transposition_key, use_transposition=use_transposition, autokey=autokey)
+    ciphertext = cipher_logic.encrypt_product_bytes(plaintext, v_key, s_key, transposition_key=transposition_key, use_transposition=use_transposition, autokey=autokey)
     enc_time = (time.perf_counter() - start) * 1000.0
     start = time.perf_counter()
-    decrypted = cipher_logic.decrypt_product(ciphertext, v_key, s_key, transposition_key=transposition_key, use_transposition=use_transposition, autokey=autokey, preserve_nonalpha=False, original_plaintext=None)
+    decrypted = cipher_logic.decrypt_product_bytes(ciphertext, v_key, s_key, transposition_key=transposition_key, use_transposition=use_transposition, autokey=autokey)
     dec_time = (time.perf_counter() - start) * 1000.0
     known_len = min(len(v_key)*2, len(plaintext))
     known_plain = plaintext[:known_len]
@@ -24,13 +27,20 @@ def run_single_trial(msg_len, v_key, s_key, use_transposition=False, transpositi
     success = (recovered[0] is not None)
     return enc_time, dec_time, attack_time, success
 
-def run_benchmarks(v_key="NETWORKSECURITY", s_key=7, use_transposition=False, transposition_key=None, autokey=False, trials=5):
+def run_benchmarks(v_key="NETWORKSECURITY", s_key=7, use_transposition=False, transposition_key=None, autokey=False, trials=5, workers=1):
     lengths = [50,100,200,500]
     results = []
+    trial_args = dict(use_transposition=use_transposition, transposition_key=transposition_key, autokey=autokey)
+    # workers=1 runs in-process; pool start-up outweighs these short trials.
+    if workers <= 1:
+        outcomes = {L: [run_single_trial(L, v_key, s_key, **trial_args) for _ in range(trials)] for L in lengths}
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {L: [pool.submit(run_single_trial, L, v_key, s_key, **trial_args) for _ in range(trials)] for L in lengths}
+            outcomes = {L: [fut.result() for fut in futures[L]] for L in lengths}
     for L in lengths:
         encs=[]; decs=[]; atks=[]; succs=[]
-        for _ in range(trials):
-            e,d,a,s = run_single_trial(L, v_key, s_key, use_transposition=use_transposition, transposition_key=transposition_key, autokey=autokey)
+        for e,d,a,s in outcomes[L]:
             encs.append(e); decs.append(d); atks.append(a); succs.append(1 if s else 0)
         results.append({
             "msg_len": L,
@@ -1,5 +1,18 @@
 # cipher_logic.py - corrected and robust implementation
 from collections import defaultdict
+from functools import lru_cache
+
+# Every byte that is not an ASCII letter.
+_NON_ALPHA_DEL = bytes(b for b in range(256) if not (chr(b).isascii() and chr(b).isalpha()))
+
+def _to_bytes(text):
+    """Return `text` (str or bytes) as uppercase A-Z-only bytes, the form the
+    byte-level cipher, attack and frequency helpers work on."""
+    if isinstance(text, str):
+        # Drop non-ASCII before uppercasing so e.g. 'ı' or 'ﬁ' cannot turn
+        # into ASCII letters the non-alpha reinsertion would not count.
+        text = text.encode('ascii', 'ignore')
+    return text.upper().translate(None, _NON_ALPHA_DEL)
 
 def normalize_text(text, preserve_nonalpha=False):
     """Normalize text:
@@ -7,135 +20,176 @@ def normalize_text(text, preserve_nonalpha=False):
     - preserve_nonalpha=True: return original string uppercased (non-alpha preserved).
     """
     if preserve_nonalpha:
-        return ''.join(c.upper() for c in text)
-    return ''.join([c.upper() for c in text if c.isalpha()])
+        return text.upper()
+    return _to_bytes(text).decode('ascii')
 
 def compare_texts(a, b):
     return a == b
 
-def _vigenere_key_stream(key, plaintext=None, autokey=False):
-    key = "".join(filter(str.isalpha, key)).upper()
+_A = ord('A')
+_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# One 256-byte translate table per Caesar shift, built once at import.
+_SHIFT_TABLES = tuple(bytes.maketrans(_ALPHABET, _ALPHABET[s:] + _ALPHABET[:s]) for s in range(26))
+
+def _shift_table(shift):
+    """bytes.translate table rotating A-Z by `shift` places (other bytes unchanged)."""
+    return _SHIFT_TABLES[shift % 26]
+
+# Keys are reused across many calls (benchmarks, demos), so their filtered
+# form, shifts and translate tables are cached instead of rebuilt per call.
+@lru_cache(maxsize=32)
+def _normalize_key(key):
+    return normalize_text(key)
+
+@lru_cache(maxsize=32)
+def _key_shifts(key):
+    shifts = tuple(ord(c) - _A for c in _normalize_key(key))
+    if not shifts:
+        raise ValueError("Vigenere key must contain alphabetic characters.")
+    return shifts
+
+@lru_cache(maxsize=64)
+def _key_tables(shifts, offset=0, inverse=False):
+    sign = -1 if inverse else 1
+    return tuple(_shift_table(sign * (s + offset)) for s in shifts)
+
+@lru_cache(maxsize=64)
+def _autokey_rows(offset=0):
+    # rows[k] rotates by k + offset.
+    return tuple(_shift_table(k + offset) for k in range(26))
+
+def _vigenere_repeating(buf, tables):
+    # Key position j shifts every len(key)-th letter starting at j.
+    out = bytearray(len(buf))
+    klen = len(tables)
+    for j, table in enumerate(tables):
+        out[j::klen] = buf[j::klen].translate(table)
+    return out
+
+def _vigenere_encrypt_bytes(buf, shifts, autokey=False, offset=0):
+    # `buf` is normalized A-Z bytes; `offset` is an extra Caesar shift fused into
+    # the same tables (out = p + k + offset) so callers avoid a second pass.
     if not autokey:
-        while True:
-            for c in key:
-                yield c
-    else:
-        for c in key:
-            yield c
-        if plaintext:
-            for c in plaintext:
-                yield c
+        return _vigenere_repeating(buf, _key_tables(shifts, offset % 26))
+    # Autokey: the key stream is the key followed by the plaintext itself.
+    rows = _autokey_rows(offset % 26)
+    stream = bytes(s + _A for s in shifts) + buf
+    return bytes(rows[k - _A][p] for k, p in zip(stream, buf))
+
+def _vigenere_decrypt_bytes(buf, shifts, autokey=False, offset=0):
+    # Inverse of _vigenere_encrypt_bytes: p = c - k - offset.
+    if not autokey:
+        return _vigenere_repeating(buf, _key_tables(shifts, offset % 26, inverse=True))
+    # stream is the key then the recovered plaintext: stream[i] keys letter i.
+    # Removing the offset first keeps c - k within [-25, 25].
+    if offset % 26:
+        buf = buf.translate(_shift_table(-offset))
+    klen = len(shifts)
+    stream = bytearray(klen + len(buf))
+    stream[:klen] = bytes(s + _A for s in shifts)
+    for i, c in enumerate(buf):
+        v = c - stream[i]
+        if v < 0:
+            v += 26
+        stream[klen + i] = v + _A
+    return stream[klen:]
 
 def vigenere_encrypt(plaintext, key, autokey=False):
-    plaintext = normalize_text(plaintext, preserve_nonalpha=False)
-    key = "".join(filter(str.isalpha, key)).upper()
-    ks = _vigenere_key_stream(key, plaintext, autokey=autokey)
-    ciphertext = []
-    for p in plaintext:
-        k = next(ks)
-        p_val = ord(p) - ord('A')
-        k_val = ord(k) - ord('A')
-        ciphertext.append(chr(((p_val + k_val) % 26) + ord('A')))
-    return ''.join(ciphertext)
+    buf = _to_bytes(plaintext)
+    return _vigenere_encrypt_bytes(buf, _key_shifts(key), autokey=autokey).decode('ascii')
 
 def vigenere_decrypt(ciphertext, key, autokey=False):
-    ciphertext = normalize_text(ciphertext, preserve_nonalpha=False)
-    key = "".join(filter(str.isalpha, key)).upper()
-    plaintext = []
-    if not autokey:
-        ks = _vigenere_key_stream(key, None, autokey=False)
-        for c in ciphertext:
-            k = next(ks)
-            p_val = (ord(c)-ord('A') - (ord(k)-ord('A')) + 26) % 26
-            plaintext.append(chr(p_val + ord('A')))
-        return ''.join(plaintext)
-    else:
-        ks = list(key)
-        for c in ciphertext:
-            k = ks.pop(0)
-            p_val = (ord(c)-ord('A') - (ord(k)-ord('A')) + 26) % 26
-            pch = chr(p_val + ord('A'))
-            plaintext.append(pch)
-            ks.append(pch)
-        return ''.join(plaintext)
+    buf = _to_bytes(ciphertext)
+    return _vigenere_decrypt_bytes(buf, _key_shifts(key), autokey=autokey).decode('ascii')
 
 def shift_encrypt(plaintext, shift):
-    plaintext = normalize_text(plaintext, preserve_nonalpha=False)
-    ciphertext = []
-    for c in plaintext:
-        v = ord(c) - ord('A')
-        ciphertext.append(chr(((v + shift) % 26) + ord('A')))
-    return ''.join(ciphertext)
+    return _to_bytes(plaintext).translate(_shift_table(shift)).decode('ascii')
 
 def shift_decrypt(ciphertext, shift):
-    ciphertext = normalize_text(ciphertext, preserve_nonalpha=False)
-    plaintext = []
-    for c in ciphertext:
-        v = ord(c) - ord('A')
-        plaintext.append(chr(((v - shift + 26) % 26) + ord('A')))
-    return ''.join(plaintext)
+    return _to_bytes(ciphertext).translate(_shift_table(-shift)).decode('ascii')
 
+@lru_cache(maxsize=16)
 def _column_order_indices(key):
     key_str = str(key)
-    return [i for ch, i in sorted([(ch, i) for i, ch in enumerate(key_str)])]
+    return tuple(i for ch, i in sorted((ch, i) for i, ch in enumerate(key_str)))
 
-def columnar_transpose_encrypt(text, key):
-    text = normalize_text(text, preserve_nonalpha=False)
-    key_str = str(key)
+def _columnar_encrypt_bytes(buf, key_str):
     klen = len(key_str)
     if klen == 0:
-        return text
-    pad_len = (-len(text)) % klen
-    text_padded = text + ('X' * pad_len)
-    rows = [text_padded[i:i+klen] for i in range(0, len(text_padded), klen)]
+        return buf
+    pad_len = (-len(buf)) % klen
+    buf = buf + (b'X' * pad_len)
     order = _column_order_indices(key_str)
-    out = []
-    for col in order:
-        for r in rows:
-            out.append(r[col])
-    return ''.join(out)
+    # Column `col` of the row-major grid is the strided slice buf[col::klen].
+    return b''.join(buf[col::klen] for col in order)
+
+def _columnar_decrypt_bytes(buf, key_str):
+    klen = len(key_str)
+    if klen == 0:
+        return buf
+    order = _column_order_indices(key_str)
+    rows_count = len(buf) // klen
+    out = bytearray(rows_count * klen)
+    for i, col in enumerate(order):
+        # Scatter ciphertext column i back to its strided row-major positions.
+        out[col::klen] = buf[i*rows_count:(i+1)*rows_count]
+    return out.rstrip(b'X')
+
+def columnar_transpose_encrypt(text, key):
+    buf = _to_bytes(text)
+    return _columnar_encrypt_bytes(buf, str(key)).decode('ascii')
 
 def columnar_transpose_decrypt(text, key):
+    # Public str API: accepts any text, so it interleaves str columns rather
+    # than using _columnar_decrypt_bytes (the *_product_bytes path).
     key_str = str(key)
     klen = len(key_str)
     if klen == 0:
         return text
     order = _column_order_indices(key_str)
     rows_count = len(text) // klen
-    grid = [['']*klen for _ in range(rows_count)]
-    pos = 0
-    for col in order:
-        for r in range(rows_count):
-            grid[r][col] = text[pos]
-            pos += 1
-    out = []
-    for r in range(rows_count):
-        out.extend(grid[r])
-    return ''.join(out).rstrip('X')
+    columns = [''] * klen
+    for i, col in enumerate(order):
+        columns[col] = text[i*rows_count:(i+1)*rows_count]
+    return ''.join(map(''.join, zip(*columns))).rstrip('X')
 
-def encrypt_product(plaintext, vigenere_key, shift_key, transposition_key=None, use_transposition=False, autokey=False):
+def encrypt_product_bytes(plaintext, vigenere_key, shift_key, transposition_key=None, use_transposition=False, autokey=False):
+    """encrypt_product on already normalized A-Z bytes, returning bytes."""
     # Validate vigenere key length per assignment
-    if len(''.join(filter(str.isalpha, vigenere_key))) < 10:
+    if len(_normalize_key(vigenere_key)) < 10:
         raise ValueError("Vigenere key must be >= 10 alphabetic characters (per assignment)." )
-    p = normalize_text(plaintext, preserve_nonalpha=False)
-    i = vigenere_encrypt(p, vigenere_key, autokey=autokey)
+    shifts = _key_shifts(vigenere_key)
+    if not (use_transposition and transposition_key):
+        # Vigenere then shift is p + k + s per letter: one fused pass.
+        return _vigenere_encrypt_bytes(plaintext, shifts, autokey=autokey, offset=shift_key)
+    i = _vigenere_encrypt_bytes(plaintext, shifts, autokey=autokey)
+    i = _columnar_encrypt_bytes(i, str(transposition_key))
+    return i.translate(_shift_table(shift_key))
+
+def decrypt_product_bytes(ciphertext, vigenere_key, shift_key, transposition_key=None, use_transposition=False, autokey=False):
+    """decrypt_product on already normalized A-Z bytes, returning bytes."""
+    shifts = _key_shifts(vigenere_key)
     if use_transposition and transposition_key:
-        i = columnar_transpose_encrypt(i, transposition_key)
-    c = shift_encrypt(i, shift_key)
-    return c
+        i = ciphertext.translate(_shift_table(-shift_key))
+        i = _columnar_decrypt_bytes(i, str(transposition_key))
+        return _vigenere_decrypt_bytes(i, shifts, autokey=autokey)
+    return _vigenere_decrypt_bytes(ciphertext, shifts, autokey=autokey, offset=shift_key)
+
+def encrypt_product(plaintext, vigenere_key, shift_key, transposition_key=None, use_transposition=False, autokey=False):
+    p = _to_bytes(plaintext)
+    c = encrypt_product_bytes(p, vigenere_key, shift_key, transposition_key=transposition_key, use_transposition=use_transposition, autokey=autokey)
+    return c.decode('ascii')
 
 def decrypt_product(ciphertext, vigenere_key, shift_key, transposition_key=None, use_transposition=False, autokey=False, preserve_nonalpha=False, original_plaintext=None):
-    i = shift_decrypt(ciphertext, shift_key)
-    if use_transposition and transposition_key:
-        i = columnar_transpose_decrypt(i, transposition_key)
-    p = vigenere_decrypt(i, vigenere_key, autokey=autokey)
+    c = _to_bytes(ciphertext)
+    p = decrypt_product_bytes(c, vigenere_key, shift_key, transposition_key=transposition_key, use_transposition=use_transposition, autokey=autokey).decode('ascii')
     if preserve_nonalpha and original_plaintext is not None:
-        res = []
-        letters = list(p)
-        for ch in original_plaintext:
-            if ch.isalpha():
-                res.append(letters.pop(0))
-            else:
-                res.append(ch)
-        return ''.join(res)
+        # Substitute decrypted letters for the original's ASCII letters in order;
+        # other characters are copied through.
+        letters = iter(p)
+        try:
+            return ''.join([next(letters) if ch.isascii() and ch.isalpha() else ch for ch in original_plaintext])
+        except StopIteration:
+            raise ValueError("original_plaintext has more letters than the decrypted text.") from None
     return p
@@ -1,9 +1,24 @@
 # frequency_analysis.py - frequency report utility
-from collections import Counter
+import cipher_logic
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LETTER_BYTES = LETTERS.encode('ascii')
+
+# Relative frequency (%) of A..Z in English text.
+ENGLISH_FREQ = (
+    8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+    6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
+)
+
+def letter_counts(buf):
+    """Return the A-Z counts of normalized bytes (see cipher_logic._to_bytes) as a 26-item list."""
+    return [buf.count(b) for b in _LETTER_BYTES]
 
 def frequency_report(ciphertext):
-    text = "".join(filter(str.isalpha, ciphertext)).upper()
-    counts = Counter(text)
-    total = sum(counts.values())
-    report = [(ch, counts[ch], counts[ch]/total if total>0 else 0.0) for ch in sorted(counts, key=counts.get, reverse=True)]
+    buf = cipher_logic._to_bytes(ciphertext)
+    counts = letter_counts(buf)
+    total = len(buf)
+    # Stable sort, so ties stay alphabetical.
+    order = sorted(range(26), key=counts.__getitem__, reverse=True)
+    report = [(LETTERS[i], counts[i], counts[i]/total) for i in order if counts[i] > 0]
     return report
@@ -75,7 +75,7 @@ def benchmark_cmd(args):
         v_key=args.vigenere_key, s_key=args.shift_key,
         use_transposition=args.use_transposition, transposition_key=args.transposition_key,
         autokey=args.autokey,
-        trials=args.trials
+        trials=args.trials, workers=args.workers
     )
     # Print all benchmark results at once in a human-readable table
     headers = ["msg_len", "avg_enc_ms", "avg_dec_ms", "avg_attack_ms", "attack_success_rate"]
@@ -113,6 +113,7 @@ def build_parser():
     atk.add_argument("--known-length", type=int, default=80, help="Known plaintext length for KPA")
     sub.add_parser("benchmark", help="Run benchmarks/experiments (outputs a readable table)")
     p.add_argument("--trials", type=int, default=5, help="Trials per message length for benchmark")
+    p.add_argument("--workers", type=int, default=1, help="Worker processes for benchmark trials (1 = run in-process)")
     return p
 
 def main():